@@ -0,0 +1,87 @@
+import io
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.scoring_engine import AI_SCORE_SYSTEM, build_ai_score_prompt, build_candidate_text, parse_ai_score
+
+
+def _client():
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is missing")
+
+    from app.core.openai_client import get_openai_client
+
+    return get_openai_client(api_key)
+
+
+def submit_batch(
+    resume_text: str,
+    jobs: List[Tuple[int, int, str]],
+    portfolio_text: str = "",
+) -> str:
+    """
+    Queue AI scoring for many (resume_id, job_id, job_text) rows on the OpenAI Batch API
+    (half the per-token price, results within 24h). Returns the batch id.
+    """
+    client = _client()
+    model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+    candidate_text = build_candidate_text(resume_text, portfolio_text, "")
+
+    lines = []
+    for resume_id, job_id, job_text in jobs:
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": f"{resume_id}:{job_id}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "temperature": 0.2,
+                        "response_format": {"type": "json_object"},
+                        "messages": [
+                            {"role": "system", "content": AI_SCORE_SYSTEM},
+                            {"role": "user", "content": build_ai_score_prompt(job_text, candidate_text)},
+                        ],
+                    },
+                }
+            )
+        )
+
+    upload = client.files.create(
+        file=("score_batch.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def fetch_batch_results(batch_id: str) -> Tuple[str, Optional[List[Tuple[int, int, Dict[str, Any]]]]]:
+    """
+    Returns (status, results). results is None until the batch has completed, then a
+    list of (resume_id, job_id, result) for every request that returned a usable score.
+    """
+    client = _client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed" or not batch.output_file_id:
+        return batch.status, None
+
+    out: List[Tuple[int, int, Dict[str, Any]]] = []
+    content = client.files.content(batch.output_file_id).text
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            resume_id, job_id = (int(x) for x in item["custom_id"].split(":", 1))
+            message = item["response"]["body"]["choices"][0]["message"]["content"]
+            out.append((resume_id, job_id, parse_ai_score(json.loads(message))))
+        except Exception:
+            continue
+    return batch.status, out
@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import json
+import os
+import re
+
+from app.core.llm_cache import llm_cache
+from app.core.positioning_brief import BRIEF_SYSTEM, LOCKED_OPENING, generate_positioning_brief
+from app.core.recruiter_outreach import OUTREACH_SYSTEM, generate_recruiter_outreach
+from app.core.resume_tailor import TAILOR_SYSTEM, tailor_resume_ai
+
+
+# Built from each generator's own system prompt, so the kit follows the same rules and
+# schemas and picks up any change to them.
+KIT_SYSTEM = (
+    "You produce three deliverables in one response for an SVP/CCO-track corporate "
+    "communications leader in federally regulated healthcare.\n"
+    "Return JSON ONLY with exactly these top-level keys:\n"
+    '- "tailored": an object following the TAILORED RÉSUMÉ instructions and schema below\n'
+    '- "positioning_brief": a string following the POSITIONING BRIEF instructions below\n'
+    '- "outreach": an object following the RECRUITER OUTREACH instructions below\n'
+    'Where a section below says "Return JSON ONLY", that describes the value of its key, '
+    "not the whole response; all three keys are required.\n\n"
+    "=== TAILORED RÉSUMÉ ===\n" + TAILOR_SYSTEM + "\n\n"
+    "=== POSITIONING BRIEF ===\n" + BRIEF_SYSTEM + "\n\n"
+    "=== RECRUITER OUTREACH ===\n" + OUTREACH_SYSTEM
+)
+
+
+@llm_cache("full_kit", KIT_SYSTEM)
+def generate_full_kit(resume_text: str, job_text: str) -> Optional[Dict[str, Any]]:
+    """
+    One OpenAI call that returns the tailored résumé, positioning brief and
+    recruiter outreach together, instead of three round-trips that each resend
+    the same résumé + job description.
+
+    Returns {"tailored": {...}, "positioning_brief": str, "outreach": {...}},
+    shaped like tailor_resume_ai / generate_positioning_brief /
+    generate_recruiter_outreach respectively, or None (never cached) if the
+    response is missing any of the three.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+
+    from app.core.openai_client import get_openai_client
+
+    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    client = get_openai_client(api_key)
+
+    user = f"""
+RESUME (SOURCE OF TRUTH):
+{resume_text}
+
+JOB DESCRIPTION:
+{job_text}
+"""
+
+    resp = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "system", "content": KIT_SYSTEM}, {"role": "user", "content": user}],
+        temperature=0.2,
+        response_format={"type": "json_object"},
+    )
+
+    text = resp.choices[0].message.content.strip()
+
+    try:
+        kit = json.loads(text)
+    except Exception:
+        m = re.search(r"\{.*\}", text, flags=re.S)
+        if not m:
+            raise
+        kit = json.loads(m.group(0))
+
+    if not isinstance(kit, dict):
+        return None
+    tailored = kit.get("tailored")
+    brief = kit.get("positioning_brief")
+    outreach = kit.get("outreach")
+    if not (isinstance(tailored, dict) and tailored):
+        return None
+    if not (isinstance(brief, str) and brief.strip()):
+        return None
+    if not (isinstance(outreach, dict) and outreach):
+        return None
+
+    return {
+        "tailored": tailored,
+        "positioning_brief": LOCKED_OPENING + brief.strip(),
+        "outreach": outreach,
+    }
+
+
+def generate_all_assets(resume_text: str, job_text: str) -> Dict[str, Any]:
+    """
+    Run the three existing generators concurrently, so wall-clock is the slowest
+    OpenAI round-trip rather than the sum of all three. Same keys as generate_full_kit;
+    a generator that fails or has no API key yields None for its key.
+    """
+
+    def _safe(fn):
+        try:
+            return fn(resume_text, job_text)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tailored = executor.submit(_safe, tailor_resume_ai)
+        brief = executor.submit(_safe, generate_positioning_brief)
+        outreach = executor.submit(_safe, generate_recruiter_outreach)
+
+        return {
+            "tailored": tailored.result(),
+            "positioning_brief": brief.result(),
+            "outreach": outreach.result(),
+        }
@@ -26,6 +26,12 @@ TAG_LEXICON: Dict[str, List[str]] = {
     "writing_materials": ["press release", "blog", "q&a", "messaging", "talking points", "presentation", "speech", "guidelines"],
 }
 
+# Lowercased once at import; tag_and_extract_signals runs for every chunk and requirement.
+TAG_LEXICON_LOWER: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (tag, tuple(kw.lower() for kw in kws)) for tag, kws in TAG_LEXICON.items()
+)
+
+RE_CRLF = re.compile(r"\r\n?")
 RE_METRICS = re.compile(r"(\b\d{1,3}%\b)|(\$\s?\d+(?:\.\d+)?\s?(?:k|m|b)\b)|(\b\d+(?:\.\d+)?\s?(?:k|m|b)\b)", re.IGNORECASE)
 RE_TEAM = re.compile(r"\b(team of|managed|led)\s+(\d{1,4})\b", re.IGNORECASE)
 RE_BUDGET = re.compile(r"\bbudget\s*(?:of)?\s*\$?\s*(\d+(?:\.\d+)?)\s*(k|m|b)?\b", re.IGNORECASE)
@@ -66,7 +72,7 @@ def chunk_text(text: str, max_chars: int = 700, min_chars: int = 200) -> List[Tu
         return []
 
     # Normalize newlines
-    t = re.sub(r"\r\n?", "\n", t)
+    t = RE_CRLF.sub("\n", t)
 
     # Split into rough sections
     parts = SECTION_SPLIT.split(t)
@@ -139,12 +145,7 @@ def tag_and_extract_signals(chunk: str) -> Tuple[List[str], Dict[str, Any], Dict
     text = chunk or ""
     low = text.lower()
 
-    tags: List[str] = []
-    for tag, kws in TAG_LEXICON.items():
-        for kw in kws:
-            if kw.lower() in low:
-                tags.append(tag)
-                break
+    tags: List[str] = [tag for tag, kws in TAG_LEXICON_LOWER if any(kw in low for kw in kws)]
 
     # Simple entities/signals
     metrics = [m.group(0) for m in RE_METRICS.finditer(text)]
@@ -217,7 +218,7 @@ def extract_requirements_deterministic(job_desc: str) -> List[Dict[str, Any]]:
     if not jd:
         return []
 
-    jd = re.sub(r"\r\n?", "\n", jd)
+    jd = RE_CRLF.sub("\n", jd)
 
     lines = [ln.strip() for ln in jd.split("\n") if ln.strip()]
     reqs: List[Dict[str, Any]] = []
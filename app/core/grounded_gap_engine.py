@@ -1,7 +1,7 @@
 import json
 import math
 import sqlite3
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from app.core.semantic_match import semantic_enabled, semantic_similarity
 from app.core.grounded_extract import EvidenceItem, extract_requirements_deterministic, load_evidence_index, tag_and_extract_signals
@@ -24,8 +24,9 @@ def _tokenize(s: str) -> List[str]:
     return [t for t in out if len(t) >= 3]
 
 
-def _jaccard(a: List[str], b: List[str]) -> float:
-    sa, sb = set(a), set(b)
+def _jaccard(a: Iterable[str], b: Iterable[str]) -> float:
+    sa = a if isinstance(a, (set, frozenset)) else set(a)
+    sb = b if isinstance(b, (set, frozenset)) else set(b)
     if not sa or not sb:
         return 0.0
     inter = len(sa.intersection(sb))
@@ -33,24 +34,33 @@ def _jaccard(a: List[str], b: List[str]) -> float:
     return inter / union if union else 0.0
 
 
+def _tokenize_evidence(evidence: List[EvidenceItem]) -> List[FrozenSet[str]]:
+    return [frozenset(_tokenize(e.chunk_text)) for e in evidence]
+
+
 def _best_evidence_for_requirement(
     req_text: str,
     req_competency: str,
     evidence: List[EvidenceItem],
     top_k: int = 3,
+    evidence_tokens: Optional[List[FrozenSet[str]]] = None,
 ) -> List[Tuple[EvidenceItem, float, str]]:
     """
     Hybrid matcher:
       - base deterministic: token Jaccard + tag overlap + evidence confidence
       - optional semantic re-rank on top candidates using embeddings (if enabled)
+    evidence_tokens: pre-tokenized evidence (parallel to `evidence`) so callers
+    matching many requirements tokenize each chunk once, not once per requirement.
     """
-    req_tokens = _tokenize(req_text)
+    req_tokens = frozenset(_tokenize(req_text))
     req_tags, _, _, _ = tag_and_extract_signals(req_text)
     req_tag_set = set(req_tags + ([req_competency] if req_competency else []))
 
+    if evidence_tokens is None:
+        evidence_tokens = _tokenize_evidence(evidence)
+
     scored: List[Tuple[EvidenceItem, float, str]] = []
-    for e in evidence:
-        ev_tokens = _tokenize(e.chunk_text)
+    for e, ev_tokens in zip(evidence, evidence_tokens):
         tok_sim = _jaccard(req_tokens, ev_tokens)
 
         ev_tag_set = set(e.tags)
@@ -151,15 +161,18 @@ def run_grounded_gap_analysis(
     job_description: str,
     resume_text: str,
     evidence_limit: int = 5000,
+    evidence: Optional[List[EvidenceItem]] = None,
 ) -> Dict[str, Any]:
     """
     Deterministic grounded gap analysis:
       - requirements from JD (deterministic)
-      - evidence from cached evidence_chunks
+      - evidence from cached evidence_chunks (or the `evidence` already loaded by the caller)
       - match via token overlap + tag overlap + confidence
     """
     requirements = extract_requirements_deterministic(job_description)
-    evidence = load_evidence_index(conn=conn, resume_id=resume_id, job_id=job_id, limit=evidence_limit)
+    if evidence is None:
+        evidence = load_evidence_index(conn=conn, resume_id=resume_id, job_id=job_id, limit=evidence_limit)
+    evidence_tokens = _tokenize_evidence(evidence)
 
     results: List[Dict[str, Any]] = []
     total_weight = 0
@@ -174,7 +187,13 @@ def run_grounded_gap_analysis(
         must_have = bool(req.get("must_have"))
         weight = int(req.get("weight") or 1)
 
-        best = _best_evidence_for_requirement(req_text=req_text, req_competency=competency, evidence=evidence, top_k=3)
+        best = _best_evidence_for_requirement(
+            req_text=req_text,
+            req_competency=competency,
+            evidence=evidence,
+            top_k=3,
+            evidence_tokens=evidence_tokens,
+        )
 
         if best:
             best_score = float(best[0][1])
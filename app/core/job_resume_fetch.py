@@ -2,14 +2,28 @@ import sqlite3
 from typing import Optional
 
 
-def _find_first_existing_column(conn: sqlite3.Connection, table: str, candidates: list[str]) -> Optional[str]:
+def _table_columns(conn: sqlite3.Connection, tables: list[str]) -> dict[str, list[str]]:
+    # One query for every candidate table's columns, instead of a PRAGMA table_info per
+    # table per lookup column. Keyed by lowercased name: SQLite table names are
+    # case-insensitive, as the PRAGMA lookup this replaced was.
     try:
         cur = conn.cursor()
-        cur.execute(f"PRAGMA table_info({table})")
-        cols = [r[1] for r in cur.fetchall()]  # type: ignore[index]
+        cur.execute(
+            "SELECT m.name, p.name FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+            f"WHERE m.type = 'table' AND lower(m.name) IN ({','.join('?' * len(tables))})",
+            [t.lower() for t in tables],
+        )
+        rows = cur.fetchall()
     except Exception:
-        return None
+        return {}
 
+    out: dict[str, list[str]] = {}
+    for table, col in rows:
+        out.setdefault(table.lower(), []).append(col)
+    return out
+
+
+def _pick_column(cols: list[str], candidates: list[str]) -> Optional[str]:
     cols_lower = {c.lower(): c for c in cols}
     for cand in candidates:
         if cand.lower() in cols_lower:
@@ -17,15 +31,22 @@ def _find_first_existing_column(conn: sqlite3.Connection, table: str, candidates
     return None
 
 
-def get_job_description(conn: sqlite3.Connection, job_id: int) -> str:
-    for table in ["jobs", "job", "job_posts", "job_post"]:
-        col = _find_first_existing_column(conn, table, ["description", "job_desc", "job_description", "raw_text", "text"])
-        id_col = _find_first_existing_column(conn, table, ["id", "job_id"])
+def _fetch_text(
+    conn: sqlite3.Connection,
+    tables: list[str],
+    text_candidates: list[str],
+    id_candidates: list[str],
+    row_id: int,
+) -> str:
+    columns = _table_columns(conn, tables)
+    for table in tables:
+        col = _pick_column(columns.get(table.lower(), []), text_candidates)
+        id_col = _pick_column(columns.get(table.lower(), []), id_candidates)
         if not col or not id_col:
             continue
         try:
             cur = conn.cursor()
-            cur.execute(f"SELECT {col} FROM {table} WHERE {id_col} = ?", (job_id,))
+            cur.execute(f"SELECT {col} FROM {table} WHERE {id_col} = ?", (row_id,))
             row = cur.fetchone()
             if row and row[0]:
                 return str(row[0])
@@ -34,18 +55,21 @@ def get_job_description(conn: sqlite3.Connection, job_id: int) -> str:
     return ""
 
 
+def get_job_description(conn: sqlite3.Connection, job_id: int) -> str:
+    return _fetch_text(
+        conn,
+        ["jobs", "job", "job_posts", "job_post"],
+        ["description", "job_desc", "job_description", "raw_text", "text"],
+        ["id", "job_id"],
+        job_id,
+    )
+
+
 def get_resume_text(conn: sqlite3.Connection, resume_id: int) -> str:
-    for table in ["resumes", "resume"]:
-        col = _find_first_existing_column(conn, table, ["raw_text", "text", "content", "resume_text"])
-        id_col = _find_first_existing_column(conn, table, ["id", "resume_id"])
-        if not col or not id_col:
-            continue
-        try:
-            cur = conn.cursor()
-            cur.execute(f"SELECT {col} FROM {table} WHERE {id_col} = ?", (resume_id,))
-            row = cur.fetchone()
-            if row and row[0]:
-                return str(row[0])
-        except Exception:
-            continue
-    return ""
+    return _fetch_text(
+        conn,
+        ["resumes", "resume"],
+        ["raw_text", "text", "content", "resume_text"],
+        ["id", "resume_id"],
+        resume_id,
+    )
@@ -0,0 +1,115 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite3")
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_SETUP_LOCK = threading.Lock()
+_setup_done = False
+
+
+def _conn() -> sqlite3.Connection:
+    global _setup_done
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    if not _setup_done:
+        # WAL mode persists in the file and the table only needs creating once, so
+        # this runs on the first connection of the process rather than on every get/set.
+        with _SETUP_LOCK:
+            if not _setup_done:
+                conn.execute("PRAGMA journal_mode=WAL;")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY,"
+                    "created_at INTEGER NOT NULL,"
+                    "value_json TEXT NOT NULL)"
+                )
+                conn.commit()
+                _setup_done = True
+    return conn
+
+
+def cache_key(namespace: str, prompt_digest: str, arguments: Dict[str, Any]) -> str:
+    payload = json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+    raw = "|".join((namespace, os.getenv("OPENAI_MODEL", ""), prompt_digest, payload))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def cache_get(key: str) -> Optional[Any]:
+    try:
+        conn = _conn()
+        try:
+            row = conn.execute(
+                "SELECT value_json FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, int(time.time()) - CACHE_TTL_SECONDS),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def cache_set(key: str, value: Any) -> None:
+    try:
+        conn = _conn()
+        try:
+            now = int(time.time())
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, created_at, value_json) VALUES (?, ?, ?)",
+                (key, now, json.dumps(value, ensure_ascii=False)),
+            )
+            # Reads already skip expired rows; deleting them here keeps the file from growing.
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - CACHE_TTL_SECONDS,))
+            conn.commit()
+        finally:
+            conn.close()
+    except (sqlite3.Error, TypeError, ValueError):
+        # A value json can't encode is simply not cached.
+        pass
+
+
+def llm_cache(namespace: str, prompt: str = "") -> Callable:
+    """
+    Disk-backed memo for OpenAI helpers, keyed by namespace + OPENAI_MODEL + prompt + arguments,
+    so repeat résumé/job pairs skip the round-trip across reruns and restarts.
+    prompt is the helper's fixed prompt text; editing it starts a fresh set of keys.
+    None results and streaming calls (stream=True) are never cached.
+    """
+    prompt_digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Bind to parameter names so f(a, b) and f(a, b=b) share a key and a
+            # positional stream=True is still seen.
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return fn(*args, **kwargs)
+            bound.apply_defaults()
+            if bound.arguments.get("stream"):
+                return fn(*args, **kwargs)
+
+            key = cache_key(namespace, prompt_digest, dict(bound.arguments))
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
+            value = fn(*args, **kwargs)
+            if value is not None:
+                cache_set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,13 @@
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: Optional[str] = None):
+    """
+    One OpenAI client per API key for the whole process, so calls share its pooled
+    httpx connections instead of paying a new client + TLS handshake every time.
+    """
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
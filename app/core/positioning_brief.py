@@ -1,53 +1,78 @@
-from typing import Optional
+from typing import Iterator, Optional, Union
 import os
 
+from app.core.llm_cache import llm_cache
 
-def generate_positioning_brief(resume_text: str, job_text: str) -> Optional[str]:
+
+LOCKED_OPENING = (
+    "I lead corporate communications as an enterprise growth and risk function using reputation, "
+    "narrative, and governance alignment to generate revenue, protect brand value, and sustain trust "
+    "in highly regulated healthcare environments. For more than 20 years I have operated as a trusted "
+    "C-suite advisor, helping organizations translate communications strategy into measurable business "
+    "outcomes, including a 20% increase in revenue and $5 million in operational cost reductions. "
+    "I sit at the intersection of regulatory complexity, corporate reputation, and business strategy.\n\n"
+)
+
+# Everything fixed lives here, ahead of the résumé/job text, for provider-side prefix caching.
+BRIEF_SYSTEM = (
+    "You are drafting a recruiter-facing Executive Positioning Brief for an SVP/CCO-track "
+    "corporate communications leader in federally regulated healthcare.\n\n"
+    "Write ONLY sections 2–5. Do NOT write or modify the opening paragraph.\n"
+    "Tone: decisive, enterprise-scale, recruiter-ready.\n\n"
+    "Write ONLY the following sections:\n"
+    "2. Enterprise Risk & Regulatory Authority\n"
+    "3. Transformation & Growth Contribution\n"
+    "4. Why This Organization / Why Now\n"
+    "5. Forward-Looking Impact Statement\n\n"
+    "Write in polished executive prose. No bullet points."
+)
+
+
+@llm_cache("positioning_brief", LOCKED_OPENING + BRIEF_SYSTEM)
+def generate_positioning_brief(
+    resume_text: str,
+    job_text: str,
+    stream: bool = False,
+) -> Optional[Union[str, Iterator[str]]]:
+    """
+    Returns the full brief, or with stream=True an iterator of text pieces
+    (locked opening first, then model tokens) suitable for st.write_stream.
+    """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return None
 
-    from openai import OpenAI
+    from app.core.openai_client import get_openai_client
 
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    client = OpenAI(api_key=api_key)
-
-    LOCKED_OPENING = (
-        "I lead corporate communications as an enterprise growth and risk function using reputation, "
-        "narrative, and governance alignment to generate revenue, protect brand value, and sustain trust "
-        "in highly regulated healthcare environments. For more than 20 years I have operated as a trusted "
-        "C-suite advisor, helping organizations translate communications strategy into measurable business "
-        "outcomes, including a 20% increase in revenue and $5 million in operational cost reductions. "
-        "I sit at the intersection of regulatory complexity, corporate reputation, and business strategy.\n\n"
-    )
+    client = get_openai_client(api_key)
 
-    system = (
-        "You are drafting a recruiter-facing Executive Positioning Brief for an SVP/CCO-track "
-        "corporate communications leader in federally regulated healthcare.\n\n"
-        "Write ONLY sections 2–5. Do NOT write or modify the opening paragraph.\n"
-        "Tone: decisive, enterprise-scale, recruiter-ready.\n"
-    )
+    user = "RESUME:\n" + resume_text + "\n\nJOB DESCRIPTION:\n" + job_text
 
-    user = (
-        "RESUME:\n"
-        + resume_text
-        + "\n\nJOB DESCRIPTION:\n"
-        + job_text
-        + "\n\n"
-        "Write ONLY the following sections:\n"
-        "2. Enterprise Risk & Regulatory Authority\n"
-        "3. Transformation & Growth Contribution\n"
-        "4. Why This Organization / Why Now\n"
-        "5. Forward-Looking Impact Statement\n\n"
-        "Write in polished executive prose. No bullet points."
-    )
+    messages = [
+        {"role": "system", "content": BRIEF_SYSTEM},
+        {"role": "user", "content": user},
+    ]
+
+    if stream:
+        chunks = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.2,
+            stream=True,
+        )
+
+        def _pieces() -> Iterator[str]:
+            yield LOCKED_OPENING
+            for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        return _pieces()
 
     response = client.chat.completions.create(
         model=model,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
+        messages=messages,
         temperature=0.2,
     )
 
@@ -3,7 +3,22 @@ import os
 import json
 import re
 
-
+from app.core.llm_cache import llm_cache
+
+# Stable prefix (no per-call values) so OpenAI's prompt cache can reuse it; the
+# résumé + job text go last in the user message.
+OUTREACH_SYSTEM = (
+    "You generate recruiter-facing outreach for an SVP/CCO-track corporate communications leader.\n"
+    "Tone: first person, concise, authoritative, non-salesy.\n"
+    "Hard bans: 'excited to apply', fluff, buzzwords.\n\n"
+    "Generate three items and return JSON ONLY with keys:\n"
+    "email: recruiter intro email (5–6 sentences)\n"
+    "linkedin: LinkedIn outreach message (2–3 sentences)\n"
+    "call_talking_points: first-call positioning talk track (5 bullet points as a single string)\n"
+)
+
+
+@llm_cache("recruiter_outreach", OUTREACH_SYSTEM)
 def generate_recruiter_outreach(
     resume_text: str,
     job_text: str,
@@ -12,31 +27,16 @@ def generate_recruiter_outreach(
     if not api_key:
         return None
 
-    from openai import OpenAI
+    from app.core.openai_client import get_openai_client
 
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    client = OpenAI(api_key=api_key)
-
-    system = (
-        "You generate recruiter-facing outreach for an SVP/CCO-track corporate communications leader.\n"
-        "Tone: first person, concise, authoritative, non-salesy.\n"
-        "Hard bans: 'excited to apply', fluff, buzzwords.\n"
-        "Return JSON ONLY."
-    )
+    client = get_openai_client(api_key)
 
-    user = (
-        "RESUME:\n" + resume_text
-        + "\n\nJOB DESCRIPTION:\n" + job_text
-        + "\n\n"
-        "Generate three items and return JSON ONLY with keys:\n"
-        "email: recruiter intro email (5–6 sentences)\n"
-        "linkedin: LinkedIn outreach message (2–3 sentences)\n"
-        "call_talking_points: first-call positioning talk track (5 bullet points as a single string)\n"
-    )
+    user = "RESUME:\n" + resume_text + "\n\nJOB DESCRIPTION:\n" + job_text
 
     response = client.chat.completions.create(
         model=model,
-        messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+        messages=[{"role": "system", "content": OUTREACH_SYSTEM}, {"role": "user", "content": user}],
         temperature=0.2,
     )
 
@@ -3,7 +3,6 @@ from types import SimpleNamespace
 from dataclasses import dataclass
 from typing import Optional
 import pathlib
-from docx import Document  # python-docx
 
 
 @dataclass
@@ -13,6 +12,8 @@ class ResumeContent:
 
 
 def extract_text_from_docx(path: str | pathlib.Path) -> str:
+    from docx import Document  # python-docx; imported on first use
+
     doc = Document(str(path))
     parts = []
 
@@ -53,4 +53,11 @@ def ensure_grounded_gap_tables(conn: sqlite3.Connection) -> None:
         """
     )
 
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_ggr_job_created
+        ON grounded_gap_results (job_id, created_at DESC);
+        """
+    )
+
     conn.commit()
@@ -26,9 +26,12 @@ KEYWORDS = {
     "govt_policy": ["government affairs", "public policy", "regulatory", "legislation", "hrsa", "hhs", "washington"],
 }
 
-def _count_hits(text: str, words: List[str]) -> int:
-    t = text.lower()
-    return sum(1 for w in words if w.lower() in t)
+# Compensation range such as "$275,000 - $375,000"
+RE_SALARY_RANGE = re.compile(r"\$?\s*([0-9]{2,3}(?:,\d{3})?)\s*[\-\–]\s*\$?\s*([0-9]{2,3}(?:,\d{3})?)")
+
+def _count_hits(text_l: str, words: List[str]) -> int:
+    # text_l is already lowercased and KEYWORDS are lowercase literals.
+    return sum(1 for w in words if w in text_l)
 
 def heuristic_score(resume_text: str, job_text: str, min_base_salary: int = 275000, **kwargs):
     jt = job_text.lower()
@@ -57,7 +60,7 @@ def heuristic_score(resume_text: str, job_text: str, min_base_salary: int = 2750
 
     # Compensation alignment: parse $275,000 - $375,000
     comp_alignment = 0.5
-    m = re.search(r"\$?\s*([0-9]{2,3}(?:,\d{3})?)\s*[\-\–]\s*\$?\s*([0-9]{2,3}(?:,\d{3})?)", job_text)
+    m = RE_SALARY_RANGE.search(job_text)
     if m:
         lo = int(m.group(1).replace(",", ""))
         hi = int(m.group(2).replace(",", ""))
@@ -104,17 +107,17 @@ def heuristic_score(resume_text: str, job_text: str, min_base_salary: int = 2750
     priority = "HIGH" if overall_0_100 >= 85 else "MEDIUM" if overall_0_100 >= 70 else "LOW"
 
     gaps = []
-    if _count_hits(job_text, KEYWORDS["ai_health"]) and not _count_hits(resume_text, KEYWORDS["ai_health"]):
+    if _count_hits(jt, KEYWORDS["ai_health"]) and not _count_hits(rt, KEYWORDS["ai_health"]):
         gaps.append("Add 1–2 bullets translating data/technology narratives (AI/precision health).")
-    if _count_hits(job_text, KEYWORDS["govt_policy"]) and not _count_hits(resume_text, KEYWORDS["govt_policy"]):
+    if _count_hits(jt, KEYWORDS["govt_policy"]) and not _count_hits(rt, KEYWORDS["govt_policy"]):
         gaps.append("Emphasize public policy / government affairs partnership experience (HRSA/HHS/340B).")
 
     strengths = []
-    if _count_hits(resume_text, KEYWORDS["healthcare"]) > 0:
+    if _count_hits(rt, KEYWORDS["healthcare"]) > 0:
         strengths.append("Deep regulated healthcare leadership experience.")
     if "crisis" in rt:
         strengths.append("Crisis-tested executive communications leader.")
-    if _count_hits(resume_text, KEYWORDS["public_company"]) > 0 or "earnings" in rt:
+    if _count_hits(rt, KEYWORDS["public_company"]) > 0 or "earnings" in rt:
         strengths.append("Public-company narrative discipline (earnings/IR readiness).")
 
     return {
@@ -132,12 +135,13 @@ def ai_score(resume_text: str, job_text: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        from openai import OpenAI
+        from app.core.openai_client import get_openai_client
+
+        client = get_openai_client(api_key)
     except Exception:
         return None
 
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    client = OpenAI(api_key=api_key)
 
     system = (
         "You are an executive recruiter and communications leader. "
@@ -31,12 +31,9 @@ def try_embed_texts(texts: List[str]) -> Optional[List[List[float]]]:
         return []
 
     try:
-        from openai import OpenAI  # type: ignore
-    except Exception:
-        return None
+        from app.core.openai_client import get_openai_client
 
-    try:
-        client = OpenAI()
+        client = get_openai_client(os.getenv("OPENAI_API_KEY"))
         model = os.getenv("GROUND_EMBED_MODEL", "text-embedding-3-small")
         resp = client.embeddings.create(model=model, input=texts)
         out: List[List[float]] = []
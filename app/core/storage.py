@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import queue
 import sqlite3
+import threading
 import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -9,15 +11,64 @@ from typing import Optional, List, Dict, Any
 # storage.py is at: repo/app/core/storage.py -> parents[3] is repo root
 DEFAULT_DB = Path(__file__).resolve().parents[3] / "job_agent.sqlite3"
 
+# Databases whose schema init_db has already run this process; every helper calls init_db.
+_INITIALIZED_DBS: set = set()
+
+
+# Idle connections per database, reused by get_conn; POOL_SIZE caps how many are kept.
+POOL_SIZE = 4
+_POOLS: Dict[str, "queue.LifoQueue[_PooledConnection]"] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class _PooledConnection(sqlite3.Connection):
+    """close() hands the connection back to its pool instead of closing it."""
+
+    _pool: "queue.LifoQueue[_PooledConnection]"
+
+    def close(self) -> None:
+        if self.in_transaction:
+            self.rollback()
+        self.row_factory = None
+        try:
+            self._pool.put_nowait(self)
+        except queue.Full:
+            super().close()
+
+
+def _pool_for(db_path: Path) -> "queue.LifoQueue[_PooledConnection]":
+    key = str(db_path)
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = queue.LifoQueue(maxsize=POOL_SIZE)
+        return _POOLS[key]
+
 
 def get_conn(db_path: Path = DEFAULT_DB) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db_path))
+    pool = _pool_for(db_path)
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        pass
+
+    # check_same_thread=False: a pooled connection is only ever held by one caller at a
+    # time, but Streamlit may run successive reruns on different threads.
+    conn = sqlite3.connect(str(db_path), factory=_PooledConnection, check_same_thread=False)
+    conn._pool = pool
     conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
     conn.execute("PRAGMA foreign_keys=ON;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA mmap_size=268435456;")
     return conn
 
 
 def init_db(db_path: Path = DEFAULT_DB) -> None:
+    db_key = str(Path(db_path).resolve())
+    if db_key in _INITIALIZED_DBS:
+        return
+
     conn = get_conn(db_path)
     cur = conn.cursor()
 
@@ -75,6 +126,17 @@ def init_db(db_path: Path = DEFAULT_DB) -> None:
         cur.execute("ALTER TABLE pipeline ADD COLUMN priority TEXT")
     except sqlite3.OperationalError:
         pass
+
+    # No pipeline view reads through these yet; drop them from databases that have
+    # them so pipeline writes don't keep paying for four indexes.
+    for index_name in (
+        "idx_pipeline_active_updated",
+        "idx_pipeline_active_stage",
+        "idx_pipeline_active_next_action",
+        "idx_pipeline_active_fit",
+    ):
+        cur.execute(f"DROP INDEX IF EXISTS {index_name}")
+
     # -------------------------
     # Phase 3: settings (email + feature flags)
     # -------------------------
@@ -166,6 +228,7 @@ def init_db(db_path: Path = DEFAULT_DB) -> None:
     
     conn.commit()
     conn.close()
+    _INITIALIZED_DBS.add(db_key)
 
 
 def save_resume(source: str, raw_text: str, db_path: Path = DEFAULT_DB) -> int:
@@ -498,6 +561,32 @@ def create_gap_question(
     return qid
 
 
+def create_gap_questions_bulk(
+    questions: List[str],
+    gap_type: Optional[str] = None,
+    job_id: Optional[int] = None,
+    db_path: Path = DEFAULT_DB,
+) -> int:
+    """
+    Insert several gap questions in one transaction (one commit instead of one per row).
+    Returns number of rows inserted.
+    """
+    now = int(time.time())
+    rows = [(now, job_id, gap_type, q) for q in questions if (q or "").strip()]
+    if not rows:
+        return 0
+
+    init_db(db_path)
+    conn = get_conn(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO gap_questions (created_at, job_id, gap_type, question) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+    conn.close()
+    return len(rows)
+
+
 def answer_gap_question(
     question_id: int,
     answer: str,
@@ -11,6 +11,12 @@ DB_PATH = os.getenv("APP_DB_PATH", "app_data.db")
 def get_conn() -> sqlite3.Connection:
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # WAL + NORMAL: commits append to the log without an fsync per transaction.
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    # Memory-mapped reads and in-memory temp tables for the dashboard's sorts/joins.
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
     return conn
 
 
@@ -38,6 +44,16 @@ def init_db(conn: sqlite3.Connection) -> None:
     )
     """)
 
+    # Older databases predate content_hash; add it in place.
+    resume_cols = {row["name"] for row in cur.execute("PRAGMA table_info(resumes)")}
+    if "content_hash" not in resume_cols:
+        cur.execute("ALTER TABLE resumes ADD COLUMN content_hash TEXT")
+
+    cur.execute("""
+    CREATE INDEX IF NOT EXISTS idx_resumes_content_hash
+    ON resumes (content_hash)
+    """)
+
     cur.execute("""
     CREATE TABLE IF NOT EXISTS scores (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,6 +75,28 @@ def init_db(conn: sqlite3.Connection) -> None:
     )
     """)
 
+    # Nothing reads gap results in bulk any more; drop the index databases created
+    # earlier so it stops adding write cost.
+    cur.execute("DROP INDEX IF EXISTS idx_grounded_gap_results_job")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS score_batches (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        batch_id TEXT NOT NULL UNIQUE,
+        resume_id INTEGER NOT NULL,
+        job_count INTEGER NOT NULL,
+        status TEXT NOT NULL DEFAULT 'submitted',
+        portfolio_text TEXT NOT NULL DEFAULT '',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    # The portfolio sent with a batch is needed again to blend its results; older
+    # databases predate the column.
+    batch_cols = {row["name"] for row in cur.execute("PRAGMA table_info(score_batches)")}
+    if "portfolio_text" not in batch_cols:
+        cur.execute("ALTER TABLE score_batches ADD COLUMN portfolio_text TEXT NOT NULL DEFAULT ''")
+
     cur.execute("""
     CREATE TABLE IF NOT EXISTS portfolio_items (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -79,6 +117,7 @@ def save_job(
     title: Optional[str] = None,
     location: Optional[str] = None,
     url: Optional[str] = None,
+    commit: bool = True,
 ) -> int:
     cur = conn.cursor()
     cur.execute(
@@ -88,20 +127,40 @@ def save_job(
         """,
         (description, company, title, location, url),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(cur.lastrowid)
 
 
-def save_resume(conn: sqlite3.Connection, source: str, raw_text: str) -> int:
+def save_resume(
+    conn: sqlite3.Connection,
+    source: str,
+    raw_text: str,
+    content_hash: Optional[str] = None,
+    commit: bool = True,
+) -> int:
     cur = conn.cursor()
+
+    # Identical résumé text reuses the existing row instead of inserting a copy. Callers hash
+    # the parsed text (not the file bytes), so the stored raw_text is what gets scored.
+    if content_hash:
+        cur.execute(
+            "SELECT id FROM resumes WHERE content_hash = ? ORDER BY id DESC LIMIT 1",
+            (content_hash,),
+        )
+        row = cur.fetchone()
+        if row:
+            return int(row["id"])
+
     cur.execute(
         """
-        INSERT INTO resumes (source, raw_text)
-        VALUES (?, ?)
+        INSERT INTO resumes (source, raw_text, content_hash)
+        VALUES (?, ?, ?)
         """,
-        (source, raw_text),
+        (source, raw_text, content_hash),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(cur.lastrowid)
 
 
@@ -111,6 +170,7 @@ def save_score(
     resume_id: int,
     result: Dict[str, Any],
     model: str,
+    commit: bool = True,
 ) -> int:
     cur = conn.cursor()
     cur.execute(
@@ -120,7 +180,8 @@ def save_score(
         """,
         (job_id, resume_id, model, json.dumps(result)),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(cur.lastrowid)
 
 
@@ -129,6 +190,7 @@ def save_grounded_gap_result(
     resume_id: int,
     job_id: int,
     result: Dict[str, Any],
+    commit: bool = True,
 ) -> int:
     cur = conn.cursor()
     cur.execute(
@@ -138,7 +200,8 @@ def save_grounded_gap_result(
         """,
         (resume_id, job_id, json.dumps(result)),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(cur.lastrowid)
 
 
@@ -168,7 +231,7 @@ def list_scores(conn: sqlite3.Connection, limit: int = 100) -> List[Dict[str, An
     cur.execute(
         """
         SELECT s.id, s.job_id, s.resume_id, s.model, s.result_json, s.created_at,
-               j.company, j.title, j.location
+               j.company, j.title, j.location, j.url
         FROM scores s
         LEFT JOIN jobs j ON j.id = s.job_id
         ORDER BY s.id DESC
@@ -178,32 +241,85 @@ def list_scores(conn: sqlite3.Connection, limit: int = 100) -> List[Dict[str, An
     )
     rows = cur.fetchall()
     out: List[Dict[str, Any]] = []
-    for row in rows:
+    # Unpack positionally (column order matches the SELECT) instead of keyed Row lookups.
+    for score_id, job_id, resume_id, model, result_json, created_at, company, title, location, url in rows:
         try:
-            result = json.loads(row["result_json"])
+            result = json.loads(result_json)
         except Exception:
             result = {}
         out.append(
             {
-                "id": row["id"],
-                "job_id": row["job_id"],
-                "resume_id": row["resume_id"],
-                "company": row["company"],
-                "title": row["title"],
-                "location": row["location"],
-                "model": row["model"],
+                "id": score_id,
+                "job_id": job_id,
+                "resume_id": resume_id,
+                "company": company,
+                "title": title,
+                "location": location,
+                "url": url,
+                "model": model,
                 "result": result,
-                "created_at": row["created_at"],
+                "created_at": created_at,
             }
         )
     return out
 
 
+def get_job_descriptions(conn: sqlite3.Connection, job_ids: List[int]) -> Dict[int, str]:
+    ids = sorted({int(j) for j in job_ids if j is not None})
+    if not ids:
+        return {}
+    placeholders = ",".join("?" for _ in ids)
+    cur = conn.cursor()
+    cur.execute(f"SELECT id, description FROM jobs WHERE id IN ({placeholders})", ids)
+    return {int(row["id"]): row["description"] for row in cur.fetchall()}
+
+
+def save_score_batch(
+    conn: sqlite3.Connection,
+    batch_id: str,
+    resume_id: int,
+    job_count: int,
+    portfolio_text: str = "",
+) -> int:
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO score_batches (batch_id, resume_id, job_count, portfolio_text)
+        VALUES (?, ?, ?, ?)
+        """,
+        (batch_id, resume_id, job_count, portfolio_text or ""),
+    )
+    conn.commit()
+    return int(cur.lastrowid)
+
+
+def list_pending_score_batches(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT b.id, b.batch_id, b.resume_id, b.job_count, b.status, b.portfolio_text, b.created_at,
+               COALESCE(r.raw_text, '') AS resume_text
+        FROM score_batches AS b
+        LEFT JOIN resumes AS r ON r.id = b.resume_id
+        WHERE b.status NOT IN ('completed', 'failed', 'expired', 'cancelled')
+        ORDER BY b.id
+        """
+    )
+    return [dict(row) for row in cur.fetchall()]
+
+
+def update_score_batch_status(conn: sqlite3.Connection, batch_id: str, status: str) -> None:
+    cur = conn.cursor()
+    cur.execute("UPDATE score_batches SET status = ? WHERE batch_id = ?", (status, batch_id))
+    conn.commit()
+
+
 def save_portfolio_text(
     conn: sqlite3.Connection,
     text: str,
     resume_id: Optional[int] = None,
     job_id: Optional[int] = None,
+    commit: bool = True,
 ) -> int:
     cur = conn.cursor()
     cur.execute(
@@ -213,7 +329,8 @@ def save_portfolio_text(
         """,
         (resume_id, job_id, safe_text(text)),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(cur.lastrowid)
 
 
@@ -270,4 +387,6 @@ def get_portfolio_texts(
         )
 
     rows = cur.fetchall()
-    return [safe_text(r["text"]) for r in rows if safe_text(r["text"])]
+    # A reused résumé row can carry the same portfolio text from several runs.
+    texts = [safe_text(r["text"]) for r in rows]
+    return list(dict.fromkeys(t for t in texts if t))
@@ -1,8 +1,7 @@
 from io import BytesIO
 from typing import Optional
 
-import docx
-import pdfplumber
+from app.utils import compact_text
 
 
 def read_txt_file(file_bytes: bytes) -> str:
@@ -13,6 +12,8 @@ def read_txt_file(file_bytes: bytes) -> str:
 
 
 def read_docx_file(file_bytes: bytes) -> str:
+    import docx
+
     try:
         bio = BytesIO(file_bytes)
         document = docx.Document(bio)
@@ -26,7 +27,32 @@ def read_docx_file(file_bytes: bytes) -> str:
         return ""
 
 
+def _read_pdf_pymupdf(file_bytes: bytes) -> Optional[str]:
+    # PyMuPDF is an optional, much faster text extractor; None means "not installed".
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        return None
+
+    try:
+        parts = []
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            for page in doc:
+                txt = (page.get_text("text") or "").strip()
+                if txt:
+                    parts.append(txt)
+        return "\n\n".join(parts).strip()
+    except Exception:
+        return ""
+
+
 def read_pdf_file(file_bytes: bytes) -> str:
+    text = _read_pdf_pymupdf(file_bytes)
+    if text:
+        return text
+
+    import pdfplumber
+
     try:
         bio = BytesIO(file_bytes)
         parts = []
@@ -41,18 +67,24 @@ def read_pdf_file(file_bytes: bytes) -> str:
         return ""
 
 
-def load_uploaded_file(uploaded_file) -> str:
-    if uploaded_file is None:
+def load_file_bytes(name: str, file_bytes: bytes) -> str:
+    name = (name or "").lower()
+
+    if name.endswith(".pdf"):
+        text = read_pdf_file(file_bytes)
+    elif name.endswith(".docx"):
+        text = read_docx_file(file_bytes)
+    elif name.endswith(".txt"):
+        text = read_txt_file(file_bytes)
+    else:
         return ""
 
-    name = (uploaded_file.name or "").lower()
-    file_bytes = uploaded_file.read()
+    # Compacted once here so every downstream copy, DB row and prompt is smaller.
+    return compact_text(text)
 
-    if name.endswith(".pdf"):
-        return read_pdf_file(file_bytes)
-    if name.endswith(".docx"):
-        return read_docx_file(file_bytes)
-    if name.endswith(".txt"):
-        return read_txt_file(file_bytes)
 
-    return ""
+def load_uploaded_file(uploaded_file) -> str:
+    if uploaded_file is None:
+        return ""
+
+    return load_file_bytes(uploaded_file.name, uploaded_file.read())
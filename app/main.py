@@ -1,32 +1,40 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 
-from app.file_parsers import load_uploaded_file
+from app.file_parsers import load_file_bytes
 from app.db import (
     get_conn,
-    get_latest_grounded_gap_result,
+    get_job_descriptions,
     get_portfolio_texts,
     init_db,
+    list_pending_score_batches,
     list_scores,
     save_grounded_gap_result,
     save_job,
     save_portfolio_text,
     save_resume,
     save_score,
+    save_score_batch,
+    update_score_batch_status,
 )
-from app.scoring_engine import score_role
-from app.utils import job_desc_mentions_salary, safe_text
+from app.scoring_engine import finalize_ai_score, score_role
+from app.utils import content_hash, job_desc_mentions_salary, rows_to_csv, safe_text
 
 
 st.set_page_config(page_title="Executive Job Agent", layout="wide")
 
-if "show_debug" not in st.session_state:
-    st.session_state["show_debug"] = False
-if "last_score_result" not in st.session_state:
-    st.session_state["last_score_result"] = None
-if "last_model_used" not in st.session_state:
-    st.session_state["last_model_used"] = None
-if "last_gap_result" not in st.session_state:
-    st.session_state["last_gap_result"] = None
+DASHBOARD_PREVIEW_ROWS = 50
+
+for _key, _default in (
+    ("show_debug", False),
+    ("last_score_result", None),
+    ("last_model_used", None),
+    ("last_gap_result", None),
+    ("application_assets", None),
+):
+    st.session_state.setdefault(_key, _default)
 
 
 @st.cache_resource
@@ -38,6 +46,84 @@ def init_connection():
 
 conn = init_connection()
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_recent_scores(_conn, limit: int = 100):
+    return list_scores(conn=_conn, limit=limit)
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=16)
+def parse_upload(name: str, digest: str, _file_bytes: bytes) -> str:
+    # Keyed on the upload's content digest (computed once by the caller), so reruns with the
+    # same file skip PDF/DOCX parsing without Streamlit re-hashing the raw bytes.
+    return load_file_bytes(name, _file_bytes)
+
+
+def score_role_cached(**kwargs):
+    # Content-addressed on the scoring inputs so a repeat click doesn't pay for another OpenAI call.
+    # A heuristic fallback from a failed AI call is not stored, so the next click retries the AI.
+    cache = st.session_state.setdefault("_score_cache", {})
+    key = content_hash("\x00".join(f"{k}={kwargs[k]}" for k in sorted(kwargs)))
+    if key in cache:
+        return cache[key]
+
+    result, model_used = score_role(**kwargs)
+    if not (kwargs.get("use_ai") and model_used == "heuristic"):
+        cache[key] = (result, model_used)
+    return result, model_used
+
+
+def run_gap_analysis_safe(resume_text: str, job_description: str, portfolio_texts, cache=None):
+    # cache: optional dict memo keyed on the input content, so re-scoring an unchanged
+    # résumé/job/portfolio skips the analysis. Fallback results are never stored.
+    key = content_hash("\x00".join([resume_text, job_description, *portfolio_texts]))
+    if cache is not None and key in cache:
+        return cache[key]
+
+    try:
+        from app.gap_engine import run_grounded_gap_analysis
+
+        result = run_grounded_gap_analysis(
+            resume_text=resume_text,
+            job_description=job_description,
+            portfolio_texts=portfolio_texts,
+        )
+        if cache is not None:
+            cache[key] = result
+        return result
+    except Exception as e:
+        return {
+            "overall_alignment_score": 0,
+            "summary": f"Grounded gap analysis unavailable: {e}",
+            "requirements": [],
+            "hard_gaps": [],
+            "partial_gaps": [],
+            "strong_matches": [],
+        }
+
+
+# Fragments (Streamlit >= 1.33) rerun only this panel when its toggle changes;
+# on older releases this is a plain function call.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+
+@_fragment
+def render_gap_insights(gap_result_ui):
+    st.divider()
+    st.subheader("Gap Insights")
+    st.write(gap_result_ui.get("summary", ""))
+    st.metric("Alignment Score", gap_result_ui.get("overall_alignment_score", 0))
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Hard gaps", len(gap_result_ui.get("hard_gaps") or []))
+    c2.metric("Partial gaps", len(gap_result_ui.get("partial_gaps") or []))
+    c3.metric("Strong matches", len(gap_result_ui.get("strong_matches") or []))
+
+    # Expanders still ship their contents to the browser while closed; only build the JSON on demand.
+    if st.toggle("Show grounded requirement details", key="show_requirement_details", value=False):
+        st.json(gap_result_ui.get("requirements") or [])
+
+
 st.title("Executive Job Agent")
 
 tab1, tab2 = st.tabs(["Score Role", "Pipeline Dashboard"])
@@ -61,6 +147,14 @@ with tab1:
         )
 
         use_ai = st.checkbox("Use OpenAI scoring", value=True)
+        verbose_ai = st.checkbox(
+            "Verbose AI scoring",
+            value=False,
+            disabled=not use_ai,
+            help="Off asks the model only for score, priority and pitch (fewer tokens); "
+            "the fit and risk lists then come from the deterministic scorer, and the "
+            "résumé-edit and interview-leverage sections are left out.",
+        )
 
         min_base = st.number_input(
             "Minimum score floor when salary is present",
@@ -70,25 +164,29 @@ with tab1:
             step=1,
         )
 
-        resume_text = load_uploaded_file(resume_file) if resume_file else ""
-        portfolio_text = load_uploaded_file(portfolio_file) if portfolio_file else ""
+        resume_text = ""
+        portfolio_text = ""
 
         if resume_file:
+            resume_bytes = resume_file.getvalue()
+            resume_text = parse_upload(resume_file.name, content_hash(resume_bytes), resume_bytes)
             st.caption(f"Loaded résumé file: {resume_file.name}")
 
         if portfolio_file:
+            portfolio_bytes = portfolio_file.getvalue()
+            portfolio_text = parse_upload(portfolio_file.name, content_hash(portfolio_bytes), portfolio_bytes)
             st.caption(f"Loaded portfolio file: {portfolio_file.name}")
 
     with col_r:
         st.subheader("2) Job description")
-        company = st.text_input("Company (optional)", value="")
-        title = st.text_input("Title (optional)", value="")
-        location = st.text_input("Location (optional)", value="")
-        url = st.text_input("Job URL (optional)", value="")
-        job_desc = st.text_area("Job description", height=320)
-
-    with st.form("score_role_form"):
-        run = st.form_submit_button("Score role")
+        # The job fields only matter on submit, so edits to them don't rerun the script one by one.
+        with st.form("score_role_form"):
+            company = st.text_input("Company (optional)", value="")
+            title = st.text_input("Title (optional)", value="")
+            location = st.text_input("Location (optional)", value="")
+            url = st.text_input("Job URL (optional)", value="")
+            job_desc = st.text_area("Job description", height=320)
+            run = st.form_submit_button("Score role")
 
     st.checkbox("Show grounded debug JSON", key="show_debug", value=False)
 
@@ -105,62 +203,126 @@ with tab1:
         if job_desc_mentions_salary(job_desc):
             min_base_for_scoring = int(min_base)
 
-        try:
-            job_id = save_job(
-                conn=conn,
-                description=job_desc,
-                company=safe_text(company) or None,
-                title=safe_text(title) or None,
-                location=safe_text(location) or None,
-                url=safe_text(url) or None,
-            )
-            resume_id = save_resume(conn=conn, source="manual", raw_text=resume_text)
-
-            if safe_text(portfolio_text):
-                save_portfolio_text(conn=conn, text=portfolio_text, resume_id=resume_id, job_id=job_id)
-
-            portfolio_texts = get_portfolio_texts(conn=conn, resume_id=resume_id, job_id=job_id, limit=50)
-            portfolio_for_scoring = "\n\n".join([x for x in portfolio_texts if safe_text(x)])
-
-            result, model_used = score_role(
-                resume_text=resume_text,
-                job_text=job_desc,
-                use_ai=use_ai,
-                min_base=min_base_for_scoring,
-                portfolio_text=portfolio_for_scoring,
-                gap_answers_text="",
+        # Clicking Score role again with unchanged inputs reuses the last run instead of
+        # re-scoring and inserting duplicate rows.
+        score_hash = content_hash(
+            "\x00".join(
+                str(x)
+                for x in (
+                    resume_text,
+                    portfolio_text,
+                    job_desc,
+                    company,
+                    title,
+                    location,
+                    url,
+                    min_base_for_scoring,
+                    use_ai,
+                    verbose_ai,
+                )
             )
-
+        )
+        if st.session_state.get("last_score_hash") == score_hash and st.session_state.get("last_score_result"):
+            st.info("Inputs unchanged since the last run; showing the previous result.")
+        else:
+            st.session_state["last_score_hash"] = None
+            # The cached `conn` is shared by every session, so a commit or rollback on it would
+            # also commit or discard another session's open inserts. The run's grouped writes
+            # get their own connection (and so their own transaction).
+            run_conn = get_conn()
             try:
-                from app.gap_engine import run_grounded_gap_analysis
-            
-                gap_result = run_grounded_gap_analysis(
-                    resume_text=resume_text,
-                    job_description=job_desc,
-                    portfolio_texts=portfolio_texts,
+                job_id = save_job(
+                    conn=run_conn,
+                    description=job_desc,
+                    company=safe_text(company) or None,
+                    title=safe_text(title) or None,
+                    location=safe_text(location) or None,
+                    url=safe_text(url) or None,
+                    commit=False,
+                )
+                resume_id = save_resume(
+                    conn=run_conn,
+                    source="manual",
+                    raw_text=resume_text,
+                    content_hash=content_hash(resume_text),
+                    commit=False,
                 )
-            except Exception as e:
-                gap_result = {
-                    "overall_alignment_score": 0,
-                    "summary": f"Grounded gap analysis unavailable: {e}",
-                    "requirements": [],
-                    "hard_gaps": [],
-                    "partial_gaps": [],
-                    "strong_matches": [],
-                }
-
-            save_score(conn=conn, job_id=job_id, resume_id=resume_id, result=result, model=model_used)
-            save_grounded_gap_result(conn=conn, resume_id=resume_id, job_id=job_id, result=gap_result)
 
-            st.session_state["last_score_result"] = result
-            st.session_state["last_model_used"] = model_used
-            st.session_state["last_gap_result"] = gap_result
-            st.session_state["last_job_id"] = job_id
+                if safe_text(portfolio_text):
+                    save_portfolio_text(
+                        conn=run_conn,
+                        text=portfolio_text,
+                        resume_id=resume_id,
+                        job_id=job_id,
+                        commit=False,
+                    )
+                # One commit for the run inputs, made before the slow scoring call so no
+                # write transaction stays open across it.
+                run_conn.commit()
+
+                # Scoped to this run's job: a reused résumé row still carries portfolios from
+                # earlier runs that the user may since have removed or replaced.
+                portfolio_texts = get_portfolio_texts(conn=run_conn, job_id=job_id, limit=50)
+                portfolio_for_scoring = "\n\n".join([x for x in portfolio_texts if safe_text(x)])
+
+                # Grounded gap analysis is local CPU work and independent of the score, so run it
+                # on a worker thread while the (network-bound) scoring call is in flight.
+                # The memo dict is fetched here because the worker has no script-run context.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    gap_future = executor.submit(
+                        run_gap_analysis_safe,
+                        resume_text=resume_text,
+                        job_description=job_desc,
+                        portfolio_texts=portfolio_texts,
+                        cache=st.session_state.setdefault("_gap_run_cache", {}),
+                    )
+                    result, model_used = score_role_cached(
+                        resume_text=resume_text,
+                        job_text=job_desc,
+                        use_ai=use_ai,
+                        min_base=min_base_for_scoring,
+                        portfolio_text=portfolio_for_scoring,
+                        gap_answers_text="",
+                        detail="full" if verbose_ai else "compact",
+                    )
+                    gap_result = gap_future.result()
+
+                save_score(
+                    conn=run_conn,
+                    job_id=job_id,
+                    resume_id=resume_id,
+                    result=result,
+                    model=model_used,
+                    commit=False,
+                )
+                save_grounded_gap_result(
+                    conn=run_conn,
+                    resume_id=resume_id,
+                    job_id=job_id,
+                    result=gap_result,
+                    commit=False,
+                )
+                run_conn.commit()
+                load_recent_scores.clear()
+
+                st.session_state.update(
+                    {
+                        "last_score_result": result,
+                        "last_model_used": model_used,
+                        "last_gap_result": gap_result,
+                        "last_job_id": job_id,
+                    }
+                )
+                if not (use_ai and model_used == "heuristic"):
+                    st.session_state["last_score_hash"] = score_hash
 
-            st.success("Scoring completed.")
+                st.success("Scoring completed.")
 
-        except Exception as e:
-            st.error(f"Run failed: {e}")
+            except Exception as e:
+                run_conn.rollback()
+                st.error(f"Run failed: {e}")
+            finally:
+                run_conn.close()
 
     result = st.session_state.get("last_score_result")
     gap_result_ui = st.session_state.get("last_gap_result")
@@ -176,14 +338,19 @@ with tab1:
         risks_or_gaps = result.get("risks_or_gaps") or []
         top_resume_edits = result.get("top_resume_edits") or []
         interview_leverage_points = result.get("interview_leverage_points") or []
+        heuristic_sections = result.get("heuristic_sections") or []
 
         if why_this_fits:
             st.subheader("Why this fits")
+            if "why_this_fits" in heuristic_sections:
+                st.caption("From the keyword heuristic (compact AI mode).")
             for item in why_this_fits:
                 st.write(f"- {item}")
 
         if risks_or_gaps:
             st.subheader("Risks / gaps")
+            if "risks_or_gaps" in heuristic_sections:
+                st.caption("From the keyword heuristic (compact AI mode).")
             for item in risks_or_gaps:
                 st.write(f"- {item}")
 
@@ -205,18 +372,7 @@ with tab1:
             st.info(f"Scoring mode used: {model_used_ui}")
 
     if gap_result_ui:
-        st.divider()
-        st.subheader("Gap Insights")
-        st.write(gap_result_ui.get("summary", ""))
-        st.metric("Alignment Score", gap_result_ui.get("overall_alignment_score", 0))
-
-        c1, c2, c3 = st.columns(3)
-        c1.metric("Hard gaps", len(gap_result_ui.get("hard_gaps") or []))
-        c2.metric("Partial gaps", len(gap_result_ui.get("partial_gaps") or []))
-        c3.metric("Strong matches", len(gap_result_ui.get("strong_matches") or []))
-
-        with st.expander("Grounded requirement details", expanded=False):
-            st.json(gap_result_ui.get("requirements") or [])
+        render_gap_insights(gap_result_ui)
 
     if st.session_state.get("show_debug"):
         st.divider()
@@ -226,34 +382,220 @@ with tab1:
         st.json(result or {})
         st.json(gap_result_ui or {})
 
-with tab2:
+    st.divider()
+    st.subheader("3) Application assets")
+    assets_hash = content_hash(resume_text + "\x00" + (job_desc or ""))
+    if st.button("Generate all assets", disabled=not (safe_text(resume_text) and safe_text(job_desc))):
+        from app.core.application_kit import generate_all_assets, generate_full_kit
+
+        with st.spinner("Generating tailored résumé, positioning brief and outreach..."):
+            # One call for all three; if that response is incomplete, fall back to the
+            # three generators run concurrently.
+            try:
+                assets = generate_full_kit(resume_text, job_desc)
+            except Exception:
+                assets = None
+            if not assets:
+                assets = generate_all_assets(resume_text, job_desc)
+        st.session_state["application_assets"] = (assets_hash, assets)
+
+    saved_assets = st.session_state.get("application_assets")
+    # Only show assets generated for the résumé and job description currently loaded.
+    assets = saved_assets[1] if saved_assets and saved_assets[0] == assets_hash else None
+    if assets:
+        tailored = assets.get("tailored") or {}
+        brief = assets.get("positioning_brief")
+        outreach = assets.get("outreach") or {}
+
+        if not (tailored or brief or outreach):
+            st.warning("No assets were generated. Check OPENAI_API_KEY.")
+
+        if tailored:
+            st.subheader("Tailored résumé")
+            if tailored.get("tailored_headline"):
+                st.write(f"**{tailored['tailored_headline']}**")
+            for item in tailored.get("tailored_summary") or []:
+                st.write(f"- {item}")
+            if tailored.get("final_resume_text"):
+                st.text(tailored["final_resume_text"])
+
+        if brief:
+            st.subheader("Positioning brief")
+            st.write(brief)
+
+        for key, label in (
+            ("email", "Recruiter email"),
+            ("linkedin", "LinkedIn message"),
+            ("call_talking_points", "Call talking points"),
+        ):
+            if outreach.get(key):
+                st.subheader(label)
+                st.write(outreach[key])
+
+
+@_fragment
+def render_dashboard(resume_text: str, portfolio_text: str, min_base: int):
+    # Inside a fragment (newer Streamlit), dashboard buttons rerun only this panel.
     st.subheader("Pipeline Dashboard")
-    rows = list_scores(conn=conn, limit=100)
+    rows = load_recent_scores(conn, limit=100)
 
     if not rows:
         st.caption("No scored roles yet.")
     else:
-        total = len(rows)
-        high = len([r for r in rows if (r.get("result") or {}).get("priority") == "High"])
-        medium = len([r for r in rows if (r.get("result") or {}).get("priority") == "Medium"])
-        low = len([r for r in rows if (r.get("result") or {}).get("priority") == "Low"])
+        # One pass builds the table and the priority counts. Job fields were stripped by
+        # safe_text when saved, so a plain `or` fallback is enough here.
+        table = []
+        priority_counts = Counter()
+        for row in rows:
+            result = row.get("result") or {}
+            priority = result.get("priority") or ""
+            priority_counts[priority] += 1
+            table.append(
+                {
+                    "Role": row.get("title") or "Untitled role",
+                    "Company": row.get("company") or "—",
+                    "Location": row.get("location") or "—",
+                    "Fit score": result.get("score", 0),
+                    "Priority": priority or "—",
+                    "Model": row.get("model") or "—",
+                    "Created": row.get("created_at"),
+                    "URL": row.get("url") or None,
+                }
+            )
 
         c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Total scored", total)
-        c2.metric("High priority", high)
-        c3.metric("Medium priority", medium)
-        c4.metric("Low priority", low)
+        c1.metric("Total scored", len(rows))
+        c2.metric("High priority", priority_counts["High"])
+        c3.metric("Medium priority", priority_counts["Medium"])
+        c4.metric("Low priority", priority_counts["Low"])
+
+        # Only the newest rows go over the wire; the rest of the loaded rows are a CSV download.
+        st.dataframe(
+            table[:DASHBOARD_PREVIEW_ROWS],
+            use_container_width=True,
+            hide_index=True,
+            column_config={"URL": st.column_config.LinkColumn("URL")},
+        )
+        if len(table) > DASHBOARD_PREVIEW_ROWS:
+            st.caption(f"Showing the {DASHBOARD_PREVIEW_ROWS} most recent of {len(table)} scored roles.")
+        # Re-encode the CSV only when a new scoring run changes the history.
+        csv_key = (rows[0].get("id"), len(rows))
+        if st.session_state.get("_scores_csv_key") != csv_key:
+            st.session_state["_scores_csv"] = rows_to_csv(table)
+            st.session_state["_scores_csv_key"] = csv_key
+
+        st.download_button(
+            f"Download last {len(rows)} (CSV)",
+            data=st.session_state["_scores_csv"],
+            file_name="scores.csv",
+            mime="text/csv",
+        )
 
-        for row in rows:
-            result = row.get("result") or {}
-            with st.container():
-                st.write(f"**{safe_text(row.get('title')) or 'Untitled role'}**")
-                st.write(f"Company: **{safe_text(row.get('company')) or '—'}**")
-                st.write(f"Location: **{safe_text(row.get('location')) or '—'}**")
-                st.write(
-                    f"Fit score: **{result.get('score', 0)}** | "
-                    f"Priority: **{safe_text(result.get('priority')) or '—'}** | "
-                    f"Model: **{safe_text(row.get('model')) or '—'}**"
+    with st.expander("Bulk re-score (OpenAI Batch API)", expanded=False):
+        st.caption(
+            "Re-scores the roles above against the résumé uploaded on the Score Role tab at half the "
+            "API price. Results arrive within 24 hours; check back with the status button."
+        )
+
+        if st.button("Submit batch re-score", disabled=not (rows and safe_text(resume_text))):
+            try:
+                from app.batch_scoring import submit_batch
+
+                batch_resume_id = save_resume(
+                    conn=conn,
+                    source="manual",
+                    raw_text=resume_text,
+                    content_hash=content_hash(resume_text),
+                )
+                descriptions = get_job_descriptions(conn=conn, job_ids=[r.get("job_id") for r in rows])
+                jobs = [(batch_resume_id, jid, desc) for jid, desc in descriptions.items() if safe_text(desc)]
+                batch_id = submit_batch(resume_text=resume_text, jobs=jobs, portfolio_text=portfolio_text)
+                save_score_batch(
+                    conn=conn,
+                    batch_id=batch_id,
+                    resume_id=batch_resume_id,
+                    job_count=len(jobs),
+                    portfolio_text=portfolio_text,
                 )
-                st.caption(f"Created: {row.get('created_at')}")
-                st.divider()
+                st.success(f"Submitted {len(jobs)} roles as batch {batch_id}.")
+            except Exception as e:
+                st.error(f"Batch submit failed: {e}")
+
+        if st.button("Re-score now (10 roles per request)", disabled=not (rows and safe_text(resume_text))):
+            try:
+                from app.scoring_engine import ai_score_roles
+
+                rescore_resume_id = save_resume(
+                    conn=conn,
+                    source="manual",
+                    raw_text=resume_text,
+                    content_hash=content_hash(resume_text),
+                )
+                descriptions = get_job_descriptions(conn=conn, job_ids=[r.get("job_id") for r in rows])
+                job_ids = [jid for jid, desc in descriptions.items() if safe_text(desc)]
+                with st.spinner(f"Re-scoring {len(job_ids)} roles..."):
+                    rescored = ai_score_roles(
+                        resume_text=resume_text,
+                        job_texts=[descriptions[jid] for jid in job_ids],
+                        portfolio_text=portfolio_text,
+                    )
+                saved = 0
+                for jid, rescored_result in zip(job_ids, rescored):
+                    if rescored_result:
+                        job_text = descriptions[jid]
+                        rescored_result = finalize_ai_score(
+                            rescored_result,
+                            resume_text=resume_text,
+                            job_text=job_text,
+                            min_base=int(min_base) if job_desc_mentions_salary(job_text) else 0,
+                            portfolio_text=portfolio_text,
+                        )
+                        save_score(
+                            conn=conn,
+                            job_id=jid,
+                            resume_id=rescore_resume_id,
+                            result=rescored_result,
+                            model="openai-packed",
+                        )
+                        saved += 1
+                load_recent_scores.clear()
+                st.success(f"Re-scored {saved} of {len(job_ids)} roles.")
+            except Exception as e:
+                st.error(f"Re-score failed: {e}")
+
+        pending_batches = list_pending_score_batches(conn=conn)
+        if pending_batches:
+            st.caption(f"{len(pending_batches)} batch(es) pending.")
+            if st.button("Check batch status"):
+                try:
+                    from app.batch_scoring import fetch_batch_results
+
+                    for batch in pending_batches:
+                        status, results = fetch_batch_results(batch["batch_id"])
+                        if results is not None:
+                            descriptions = get_job_descriptions(conn=conn, job_ids=[jid for _, jid, _ in results])
+                            for batch_resume_id, jid, batch_result in results:
+                                job_text = descriptions.get(jid, "")
+                                batch_result = finalize_ai_score(
+                                    batch_result,
+                                    resume_text=batch["resume_text"],
+                                    job_text=job_text,
+                                    min_base=int(min_base) if job_desc_mentions_salary(job_text) else 0,
+                                    portfolio_text=batch["portfolio_text"],
+                                )
+                                save_score(
+                                    conn=conn,
+                                    job_id=jid,
+                                    resume_id=batch_resume_id,
+                                    result=batch_result,
+                                    model="openai-batch",
+                                )
+                            load_recent_scores.clear()
+                        update_score_batch_status(conn=conn, batch_id=batch["batch_id"], status=status)
+                        st.write(f"Batch {batch['batch_id']}: **{status}**")
+                except Exception as e:
+                    st.error(f"Batch status check failed: {e}")
+
+
+with tab2:
+    render_dashboard(resume_text, portfolio_text, min_base)
@@ -1,9 +1,9 @@
 import json
 import os
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.utils import clamp, count_keyword_hits, safe_text
-from openai import OpenAI
+from app.core.llm_cache import llm_cache
+from app.utils import clamp, safe_text
 
 
 EXEC_SIGNAL_KEYWORDS = {
@@ -18,6 +18,52 @@ EXEC_SIGNAL_KEYWORDS = {
 }
 
 
+ROLE_REQUIREMENTS = (
+    "corporate communications",
+    "media relations",
+    "brand",
+    "reputation",
+    "executive communications",
+    "issues management",
+    "internal communications",
+    "thought leadership",
+    "product communications",
+    "measurement",
+    "stakeholders",
+    "global",
+)
+DOMAIN_REQUIREMENTS = (
+    "healthcare",
+    "pharma",
+    "biotech",
+    "regulated",
+    "government",
+    "policy",
+    "regulatory",
+    "public affairs",
+)
+DEPTH_REQUIREMENTS = (
+    "strategy",
+    "leadership",
+    "cross-functional",
+    "transformation",
+    "crisis",
+    "analytics",
+    "earned media",
+)
+
+
+def _count_hits(text_l: str, keywords) -> int:
+    # text_l is already lowercased and keywords are lowercase literals, so skip
+    # count_keyword_hits' per-call safe_text/lower copies of the whole candidate text.
+    return sum(1 for kw in keywords if kw in text_l)
+
+
+def is_off_domain_job(job_text: str) -> bool:
+    job_l = safe_text(job_text).lower()
+    return "communications" not in job_l and _count_hits(job_l, ROLE_REQUIREMENTS) == 0
+
+
 def build_candidate_text(
     resume_text: str,
     portfolio_text: str = "",
@@ -45,10 +91,10 @@ def executive_signal_scores(candidate_text: str, job_text: str) -> Dict[str, Any
     transformation = 0
     crisis = 0
 
-    board_hits = count_keyword_hits(text, EXEC_SIGNAL_KEYWORDS["board"])
-    c_suite_hits = count_keyword_hits(text, EXEC_SIGNAL_KEYWORDS["c_suite"])
-    transformation_hits = count_keyword_hits(text, EXEC_SIGNAL_KEYWORDS["transformation"])
-    crisis_hits = count_keyword_hits(text, EXEC_SIGNAL_KEYWORDS["crisis"])
+    board_hits = _count_hits(text, EXEC_SIGNAL_KEYWORDS["board"])
+    c_suite_hits = _count_hits(text, EXEC_SIGNAL_KEYWORDS["c_suite"])
+    transformation_hits = _count_hits(text, EXEC_SIGNAL_KEYWORDS["transformation"])
+    crisis_hits = _count_hits(text, EXEC_SIGNAL_KEYWORDS["crisis"])
 
     if board_hits >= 2:
         board = 5
@@ -83,45 +129,10 @@ def executive_signal_scores(candidate_text: str, job_text: str) -> Dict[str, Any
 
 def requirement_fit_score(candidate_text: str, job_text: str) -> Dict[str, Any]:
     text = safe_text(candidate_text).lower()
-    job_l = safe_text(job_text).lower()
 
-    role_requirements = [
-        "corporate communications",
-        "media relations",
-        "brand",
-        "reputation",
-        "executive communications",
-        "issues management",
-        "internal communications",
-        "thought leadership",
-        "product communications",
-        "measurement",
-        "stakeholders",
-        "global",
-    ]
-    domain_requirements = [
-        "healthcare",
-        "pharma",
-        "biotech",
-        "regulated",
-        "government",
-        "policy",
-        "regulatory",
-        "public affairs",
-    ]
-    depth_requirements = [
-        "strategy",
-        "leadership",
-        "cross-functional",
-        "transformation",
-        "crisis",
-        "analytics",
-        "earned media",
-    ]
-
-    role_hits = count_keyword_hits(text, [x for x in role_requirements if x in job_l or True])
-    domain_hits = count_keyword_hits(text, domain_requirements)
-    depth_hits = count_keyword_hits(text, depth_requirements)
+    role_hits = _count_hits(text, ROLE_REQUIREMENTS)
+    domain_hits = _count_hits(text, DOMAIN_REQUIREMENTS)
+    depth_hits = _count_hits(text, DEPTH_REQUIREMENTS)
 
     role_score = min(45, role_hits * 4)
     domain_score = min(20, domain_hits * 3)
@@ -238,27 +249,18 @@ def heuristic_score_role(
     }
 
 
-def ai_score_role(
-    resume_text: str,
-    job_text: str,
-    portfolio_text: str = "",
-    gap_answers_text: str = "",
-) -> Dict[str, Any]:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is missing")
-
-    client = OpenAI(api_key=api_key)
+AI_SCORE_SYSTEM = "You are a careful executive recruiting analyst."
 
-    candidate_text = build_candidate_text(resume_text, portfolio_text, gap_answers_text)
 
-    prompt = f"""
-You are scoring an executive candidate against a job description.
+AI_SCORE_KEYS = {
+    "full": "score, priority, why_this_fits, risks_or_gaps, top_resume_edits, interview_leverage_points, two_line_pitch",
+    # Compact asks only for the score and pitch; score_role fills why_this_fits and
+    # risks_or_gaps from the heuristic and records them in heuristic_sections.
+    "compact": "score, priority, two_line_pitch",
+}
 
-Return strict JSON with keys:
-score, priority, why_this_fits, risks_or_gaps, top_resume_edits, interview_leverage_points, two_line_pitch
 
-Scoring guidance:
+AI_SCORE_GUIDANCE = """Scoring guidance:
 - 90-100 exceptional
 - 80-89 very strong
 - 70-79 viable with gaps
@@ -271,21 +273,95 @@ Focus on:
 - transformation scale
 - crisis/issues management
 - media/brand/reputation leadership
-- regulated/global complexity
+- regulated/global complexity"""
+
+
+def build_ai_score_prompt(job_text: str, candidate_text: str, detail: str = "full") -> str:
+    # Candidate before job: scoring many jobs for one résumé then shares the longest
+    # possible prefix, which OpenAI's automatic prompt cache bills at a discount.
+    keys = AI_SCORE_KEYS.get(detail, AI_SCORE_KEYS["full"])
+    return f"""
+You are scoring an executive candidate against a job description.
+
+Return strict JSON with keys:
+{keys}
+
+{AI_SCORE_GUIDANCE}
+
+CANDIDATE:
+{candidate_text}
 
 JOB DESCRIPTION:
 {job_text}
+"""
+
+
+def build_ai_score_roles_prompt(job_texts: List[str], candidate_text: str) -> str:
+    # The multi-job schema lives in the instructions, not in the data section, so the
+    # model is never told to return a single object.
+    jobs_block = "\n\n".join(f"[JOB {i}]\n{text}" for i, text in enumerate(job_texts))
+    return f"""
+You are scoring an executive candidate against {len(job_texts)} job descriptions.
+
+Return strict JSON of the form {{"results": [...]}} with exactly one object per job.
+Each object has keys:
+job_index, {AI_SCORE_KEYS["full"]}
+job_index is the number n from that job's [JOB n] header.
+
+{AI_SCORE_GUIDANCE}
 
 CANDIDATE:
 {candidate_text}
+
+JOB DESCRIPTIONS:
+{jobs_block}
 """
 
+
+def parse_ai_score(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "score": int(clamp(int(data.get("score", 0)), 0, 100)),
+        "priority": safe_text(data.get("priority")) or "Medium",
+        "why_this_fits": data.get("why_this_fits", []) or [],
+        "risks_or_gaps": data.get("risks_or_gaps", []) or [],
+        "top_resume_edits": data.get("top_resume_edits", []) or [],
+        "interview_leverage_points": data.get("interview_leverage_points", []) or [],
+        "two_line_pitch": safe_text(data.get("two_line_pitch")),
+    }
+
+
+# The templates rendered with placeholder inputs stand in for the prompt text in the cache key.
+@llm_cache(
+    "ai_score_role",
+    AI_SCORE_SYSTEM
+    + build_candidate_text("_", "_", "_")
+    + build_ai_score_prompt("", "", detail="full")
+    + build_ai_score_prompt("", "", detail="compact"),
+)
+def ai_score_role(
+    resume_text: str,
+    job_text: str,
+    portfolio_text: str = "",
+    gap_answers_text: str = "",
+    detail: str = "full",
+) -> Dict[str, Any]:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is missing")
+
+    from app.core.openai_client import get_openai_client
+
+    client = get_openai_client(api_key)
+
+    candidate_text = build_candidate_text(resume_text, portfolio_text, gap_answers_text)
+    prompt = build_ai_score_prompt(job_text, candidate_text, detail=detail)
+
     resp = client.chat.completions.create(
         model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
         temperature=0.2,
         response_format={"type": "json_object"},
         messages=[
-            {"role": "system", "content": "You are a careful executive recruiting analyst."},
+            {"role": "system", "content": AI_SCORE_SYSTEM},
             {"role": "user", "content": prompt},
         ],
     )
@@ -293,15 +369,100 @@ CANDIDATE:
     content = resp.choices[0].message.content
     data = json.loads(content)
 
-    return {
-        "score": int(clamp(int(data.get("score", 0)), 0, 100)),
-        "priority": safe_text(data.get("priority")) or "Medium",
-        "why_this_fits": data.get("why_this_fits", []) or [],
-        "risks_or_gaps": data.get("risks_or_gaps", []) or [],
-        "top_resume_edits": data.get("top_resume_edits", []) or [],
-        "interview_leverage_points": data.get("interview_leverage_points", []) or [],
-        "two_line_pitch": safe_text(data.get("two_line_pitch")),
-    }
+    return parse_ai_score(data)
+
+
+def ai_score_roles(
+    resume_text: str,
+    job_texts: List[str],
+    portfolio_text: str = "",
+    gap_answers_text: str = "",
+    group_size: int = 10,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Score many jobs against one candidate, packing up to group_size job descriptions
+    into each prompt so the candidate text is sent once per group instead of once per job.
+    Results are in job_texts order; a job the model skipped, or whose group or item failed
+    to parse, comes back as None.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is missing")
+
+    from app.core.openai_client import get_openai_client
+
+    client = get_openai_client(api_key)
+    candidate_text = build_candidate_text(resume_text, portfolio_text, gap_answers_text)
+
+    out: List[Optional[Dict[str, Any]]] = [None] * len(job_texts)
+    for start in range(0, len(job_texts), group_size):
+        group = job_texts[start:start + group_size]
+        prompt = build_ai_score_roles_prompt(group, candidate_text)
+
+        # One bad group (API error, truncated JSON) must not discard the groups already scored.
+        try:
+            resp = client.chat.completions.create(
+                model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
+                temperature=0.2,
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": AI_SCORE_SYSTEM},
+                    {"role": "user", "content": prompt},
+                ],
+            )
+            data = json.loads(resp.choices[0].message.content)
+            items = data.get("results") or []
+        except Exception:
+            continue
+
+        for item in items:
+            try:
+                idx = int(item.get("job_index"))
+                if 0 <= idx < len(group):
+                    out[start + idx] = parse_ai_score(item)
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+    return out
+
+
+def blend_with_heuristic(result: Dict[str, Any], heuristic: Dict[str, Any], detail: str = "full") -> Dict[str, Any]:
+    # Blend AI with deterministic score for stability. Every AI path (interactive, packed,
+    # Batch API) goes through here so saved scores share one scale.
+    blended_score = int(round((result["score"] * 0.6) + (heuristic["score"] * 0.4)))
+    result["score"] = int(clamp(blended_score, 0, 100))
+    result["subscores"] = heuristic.get("subscores", {})
+
+    # Compact prompts never ask for the lists, so borrow the two the heuristic derives
+    # from the inputs (its edits/leverage points are canned text) and say so. In full
+    # mode an empty list is the model's answer and is left alone.
+    if detail == "compact":
+        filled = []
+        for key in ("why_this_fits", "risks_or_gaps"):
+            if not result.get(key) and heuristic.get(key):
+                result[key] = heuristic[key]
+                filled.append(key)
+        result["heuristic_sections"] = filled
+    return result
+
+
+def finalize_ai_score(
+    result: Dict[str, Any],
+    resume_text: str,
+    job_text: str,
+    min_base: int,
+    portfolio_text: str = "",
+    gap_answers_text: str = "",
+) -> Dict[str, Any]:
+    """Blend a raw AI score (e.g. from ai_score_roles or the Batch API) exactly as score_role does."""
+    heuristic = heuristic_score_role(
+        resume_text=resume_text,
+        job_text=job_text,
+        min_base=min_base,
+        portfolio_text=portfolio_text,
+        gap_answers_text=gap_answers_text,
+    )
+    return blend_with_heuristic(result, heuristic)
 
 
 def score_role(
@@ -311,40 +472,46 @@ def score_role(
     min_base: int,
     portfolio_text: str = "",
     gap_answers_text: str = "",
+    detail: str = "full",
 ) -> Tuple[Dict[str, Any], str]:
     try:
+        heuristic = None
         if use_ai:
             try:
-                result = ai_score_role(
+                heuristic = heuristic_score_role(
                     resume_text=resume_text,
                     job_text=job_text,
+                    min_base=min_base,
                     portfolio_text=portfolio_text,
                     gap_answers_text=gap_answers_text,
                 )
 
-                heuristic = heuristic_score_role(
+                # A job description with no communications signal at all is an obvious
+                # reject; don't spend an OpenAI call on it.
+                if is_off_domain_job(job_text):
+                    return heuristic, "heuristic-prefilter"
+
+                result = ai_score_role(
                     resume_text=resume_text,
                     job_text=job_text,
-                    min_base=min_base,
                     portfolio_text=portfolio_text,
                     gap_answers_text=gap_answers_text,
+                    detail=detail,
                 )
 
-                # Blend AI with deterministic score for stability
-                blended_score = int(round((result["score"] * 0.6) + (heuristic["score"] * 0.4)))
-                result["score"] = int(clamp(blended_score, 0, 100))
-                result["subscores"] = heuristic.get("subscores", {})
-                return result, "openai+heuristic"
+                return blend_with_heuristic(result, heuristic, detail=detail), "openai+heuristic"
             except Exception:
                 pass
 
-        heuristic = heuristic_score_role(
-            resume_text=resume_text,
-            job_text=job_text,
-            min_base=min_base,
-            portfolio_text=portfolio_text,
-            gap_answers_text=gap_answers_text,
-        )
+        # Reuse the heuristic from the AI branch if the OpenAI call is what failed.
+        if heuristic is None:
+            heuristic = heuristic_score_role(
+                resume_text=resume_text,
+                job_text=job_text,
+                min_base=min_base,
+                portfolio_text=portfolio_text,
+                gap_answers_text=gap_answers_text,
+            )
         return heuristic, "heuristic"
 
     except Exception as e:
@@ -1,6 +1,16 @@
+import csv
+import hashlib
+import io
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+RE_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+RE_WHITESPACE = re.compile(r"\s+")
+RE_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+RE_WORD_TOKEN = re.compile(r"[a-zA-Z][a-zA-Z0-9&/\-]+")
+RE_INLINE_SPACE = re.compile(r"[ \t\f\v\u00a0]+")
+RE_BLANK_LINES = re.compile(r"\n\s*\n+")
 
 
 def safe_text(value: Any) -> str:
@@ -9,9 +19,15 @@ def safe_text(value: Any) -> str:
     return str(value).strip()
 
 
+def content_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def slugify_filename(value: str) -> str:
     value = safe_text(value).lower()
-    value = re.sub(r"[^a-z0-9]+", "_", value)
+    value = RE_SLUG_NONALNUM.sub("_", value)
     return value.strip("_") or "file"
 
 
@@ -21,14 +37,23 @@ def clamp(value: float, low: float, high: float) -> float:
 
 def normalize_whitespace(text: str) -> str:
     text = safe_text(text)
-    return re.sub(r"\s+", " ", text).strip()
+    return RE_WHITESPACE.sub(" ", text).strip()
+
+
+def compact_text(text: str) -> str:
+    # Collapse space/tab runs and repeated blank lines but keep line breaks, which the
+    # section splitter and line matchers rely on.
+    text = safe_text(text).replace("\r\n", "\n").replace("\r", "\n")
+    text = RE_INLINE_SPACE.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return RE_BLANK_LINES.sub("\n\n", text).strip()
 
 
 def split_sentences(text: str) -> List[str]:
     text = safe_text(text)
     if not text:
         return []
-    parts = re.split(r"(?<=[.!?])\s+|\n+", text)
+    parts = RE_SENTENCE_SPLIT.split(text)
     return [p.strip() for p in parts if p.strip()]
 
 
@@ -45,9 +70,15 @@ def count_keyword_hits(text: str, keywords: List[str]) -> int:
     return len(keyword_hits(text, keywords))
 
 
+def _word_tokens(text: str) -> set:
+    return set(RE_WORD_TOKEN.findall(safe_text(text).lower()))
+
+
 def token_overlap_score(a: str, b: str) -> float:
-    a_tokens = set(re.findall(r"[a-zA-Z][a-zA-Z0-9&/\-]+", safe_text(a).lower()))
-    b_tokens = set(re.findall(r"[a-zA-Z][a-zA-Z0-9&/\-]+", safe_text(b).lower()))
+    return _overlap_ratio(_word_tokens(a), _word_tokens(b))
+
+
+def _overlap_ratio(a_tokens: set, b_tokens: set) -> float:
     if not a_tokens or not b_tokens:
         return 0.0
     overlap = len(a_tokens & b_tokens)
@@ -57,9 +88,11 @@ def token_overlap_score(a: str, b: str) -> float:
 
 def top_matching_lines(source_text: str, query_text: str, limit: int = 5) -> List[str]:
     lines = [x.strip() for x in safe_text(source_text).splitlines() if x.strip()]
+    # Tokenize the query once rather than once per candidate line.
+    query_tokens = _word_tokens(query_text)
     scored = []
     for line in lines:
-        score = token_overlap_score(line, query_text)
+        score = _overlap_ratio(_word_tokens(line), query_tokens)
         if score > 0:
             scored.append((score, line))
     scored.sort(key=lambda x: x[0], reverse=True)
@@ -70,6 +103,16 @@ def pretty_json(data: Dict[str, Any]) -> str:
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+def rows_to_csv(rows: List[Dict[str, Any]]) -> bytes:
+    if not rows:
+        return b""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
 def job_desc_mentions_salary(job_desc: str) -> bool:
     jd = safe_text(job_desc).lower()
     salary_terms = [